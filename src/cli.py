@@ -1,19 +1,22 @@
 import argparse
+import functools
 import time
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Callable, Mapping, Sequence, Type
 import os
 
 from .puzzle import Puzzle
-from .search import SEARCH_ALGORITHMS
+from .search import SEARCH_ALGORITHMS, Search
 from .heuristics import HEURISTICS
 
 
-def format_state(state: List[int]) -> str:
+def format_state(state: Sequence[int]) -> str:
     """Format a state as a string with 'b' for the blank."""
     return "(" + " ".join(str(x) if x != 0 else "b" for x in state) + ")"
 
 
-def format_path(path: List[List[int]]) -> str:
+def format_path(path: Sequence[Sequence[int]]) -> str:
     """Format a solution path for display."""
     return " → ".join(format_state(state) for state in path)
 
@@ -33,17 +36,19 @@ def read_initial_states(filepath: str, size: int = 3) -> List[str]:
     # Read existing states if the file exists
     try:
         with open(filepath, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    # Only use states that match the expected size
-                    state_values = line.split()
-                    expected_length = size * size
-                    if len(state_values) == expected_length:
-                        states.append(line)
+            lines = f.read().splitlines()
     except FileNotFoundError:
         # If file doesn't exist, we'll generate all 5 puzzles
-        pass
+        lines = []
+
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            # Only use states that match the expected size
+            state_values = line.split()
+            expected_length = size * size
+            if len(state_values) == expected_length:
+                states.append(line)
 
     # Check if we need to generate more states
     if len(states) < 5:
@@ -77,23 +82,56 @@ def read_initial_states(filepath: str, size: int = 3) -> List[str]:
     return states
 
 
+@functools.lru_cache(maxsize=256)
 def run_experiment(
     algorithm_name: str, heuristic_name: str, initial_state: str, max_steps: int
-) -> Dict[str, Any]:
-    """Run a single experiment with the given parameters."""
-    # Create the puzzle from the initial state
-    puzzle = Puzzle.from_string(initial_state)
-
+) -> Mapping[str, Any]:
+    """Run a single experiment with the given parameters.
+
+    Searches are deterministic, so results are cached per set of arguments
+    and repeated calls (e.g. the same state from several tests) return the
+    first run's result. Since it is shared between callers, the result is a
+    read-only view (its "solution_path" is already a tuple of state tuples). Its
+    "time" is that of the first run and is stale on later calls; use
+    run_resolved_experiment to time a fresh run.
+    """
     # Get the search algorithm
     if algorithm_name not in SEARCH_ALGORITHMS:
         raise ValueError(f"Unknown algorithm: {algorithm_name}")
-    search_class = SEARCH_ALGORITHMS[algorithm_name]
-    search = search_class(max_steps=max_steps)
 
     # Get the heuristic function
     if heuristic_name not in HEURISTICS:
         raise ValueError(f"Unknown heuristic: {heuristic_name}")
-    heuristic_func = HEURISTICS[heuristic_name]
+
+    result = run_resolved_experiment(
+        SEARCH_ALGORITHMS[algorithm_name],
+        HEURISTICS[heuristic_name],
+        initial_state,
+        max_steps,
+        algorithm_name,
+        heuristic_name,
+    )
+    return MappingProxyType(result)
+
+
+def run_resolved_experiment(
+    search_class: Type[Search],
+    heuristic_func: Callable[[Puzzle], int],
+    initial_state: str,
+    max_steps: int,
+    algorithm_name: str,
+    heuristic_name: str,
+) -> Dict[str, Any]:
+    """Run a single experiment with an already resolved algorithm and heuristic.
+
+    Callers running many experiments look the names up once and call this
+    directly, instead of going through run_experiment for every state.
+    The names are only used to label the result. The "solution_path" is a
+    tuple of state tuples, or None if no solution was found.
+    """
+    # Create the puzzle from the initial state
+    puzzle = Puzzle.from_string(initial_state)
+    search = search_class(max_steps=max_steps)
 
     # Run the search
     start_time = time.time()
@@ -110,48 +148,75 @@ def run_experiment(
         "nodes_generated": search.nodes_generated,
     }
 
+    # The path is only formatted (format_path) where it is displayed
     if goal_node:
-        solution_path = goal_node.get_solution_path()
+        solution_path = tuple(map(tuple, goal_node.get_solution_path()))
         result["solution_found"] = True
         result["solution_length"] = len(solution_path) - 1  # Exclude initial state
         result["solution_path"] = solution_path
-        result["formatted_path"] = format_path(solution_path)
     else:
         result["solution_found"] = False
         result["solution_length"] = None
         result["solution_path"] = None
-        result["formatted_path"] = None
 
     return result
 
 
 def run_all_experiments(
-    states: List[str], max_steps: int
+    states: List[str], max_steps: int, max_workers: Optional[int] = None
 ) -> Dict[str, List[Dict[str, Any]]]:
-    """Run all combinations of algorithms and heuristics on all states."""
-    results = {}
+    """Run all combinations of algorithms and heuristics on all states.
 
-    for algorithm_name in SEARCH_ALGORITHMS:
-        for heuristic_name in HEURISTICS:
-            key = f"{algorithm_name}-{heuristic_name}"
-            results[key] = []
+    Every (algorithm, heuristic, state) run is independent and CPU-bound, so
+    they are spread over a pool of worker processes.
 
+    Args:
+        states: Initial state strings to solve
+        max_steps: Maximum number of steps per search
+        max_workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Results keyed by "algorithm-heuristic", in the order of states
+    """
+    results = {}
+    tasks = []
+
+    # Resolve each algorithm and heuristic once, not once per state
+    for algorithm_name, search_class in SEARCH_ALGORITHMS.items():
+        for heuristic_name, heuristic_func in HEURISTICS.items():
+            results[f"{algorithm_name}-{heuristic_name}"] = []
             for state in states:
-                try:
-                    result = run_experiment(
-                        algorithm_name=algorithm_name,
-                        heuristic_name=heuristic_name,
-                        initial_state=state,
-                        max_steps=max_steps,
-                    )
-                    results[key].append(result)
-                except Exception as e:
-                    print(f"Error running {key} on {state}: {e}")
+                tasks.append(
+                    (search_class, heuristic_func, state, algorithm_name, heuristic_name)
+                )
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_resolved_experiment,
+                search_class,
+                heuristic_func,
+                state,
+                max_steps,
+                algorithm_name,
+                heuristic_name,
+            )
+            for search_class, heuristic_func, state, algorithm_name, heuristic_name in tasks
+        ]
+
+        # Collect in submission order so each key keeps the order of states
+        for task, future in zip(tasks, futures):
+            _, _, state, algorithm_name, heuristic_name = task
+            key = f"{algorithm_name}-{heuristic_name}"
+            try:
+                results[key].append(future.result())
+            except Exception as e:
+                print(f"Error running {key} on {state}: {e}")
 
     return results
 
 
-def print_results(results: Dict[str, List[Dict[str, Any]]]):
+def print_results(results: Dict[str, List[Mapping[str, Any]]]):
     """Print formatted results to the console."""
     for key, experiments in results.items():
         if "-" in key:
@@ -177,7 +242,7 @@ def print_results(results: Dict[str, List[Dict[str, Any]]]):
             print(f"Initial state {i+1}: {exp['initial_state']}")
             if exp["solution_found"]:
                 print(f"Solution found in {exp['solution_length']} steps")
-                print(f"Solution path: {exp['formatted_path']}")
+                print(f"Solution path: {format_path(exp['solution_path'])}")
             else:
                 print("No solution found within the step limit.")
             print(f"Nodes expanded: {exp['nodes_expanded']}")
@@ -186,88 +251,99 @@ def print_results(results: Dict[str, List[Dict[str, Any]]]):
 
 
 def generate_markdown_report(
-    results: Dict[str, List[Dict[str, Any]]], output_path: str, size: int = 3
+    results: Dict[str, List[Mapping[str, Any]]], output_path: str, size: int = 3
 ):
     """Generate a Markdown report of the experiment results."""
-    with open(output_path, "w" if size == 3 else "a") as f:
-        if size == 3:
-            f.write("# 8-Puzzle Solver Experiment Results\n\n")
-        else:  # size == 4
-            f.write("\n\n# Extra Credit: 15-Puzzle (4×4) Results\n\n")
-
-        # Summarize the heuristics used
-        f.write("## Heuristics Used\n\n")
-        f.write("### Heuristic 1: Misplaced Tiles\n")
-        f.write("Counts the number of tiles that are not in their goal position.\n\n")
-
-        f.write("### Heuristic 2: Manhattan Distance\n")
-        f.write(
-            "Sums the Manhattan distance (|x1 - x2| + |y1 - y2|) for each tile from its current position to its goal position.\n\n"
-        )
+    # Collect the report in memory and write it out in one go
+    parts = []
+    if size == 3:
+        parts.append("# 8-Puzzle Solver Experiment Results\n\n")
+    else:  # size == 4
+        parts.append("\n\n# Extra Credit: 15-Puzzle (4×4) Results\n\n")
+
+    # Summarize the heuristics used
+    parts.append("## Heuristics Used\n\n")
+    parts.append("### Heuristic 1: Misplaced Tiles\n")
+    parts.append("Counts the number of tiles that are not in their goal position.\n\n")
+
+    parts.append("### Heuristic 2: Manhattan Distance\n")
+    parts.append(
+        "Sums the Manhattan distance (|x1 - x2| + |y1 - y2|) for each tile from its current position to its goal position.\n\n"
+    )
 
-        f.write("### Heuristic 3: Linear Conflict\n")
-        f.write(
-            "Combines Manhattan distance with a penalty for linear conflicts. A linear conflict occurs when two tiles are in their goal row/column but in the wrong order.\n\n"
-        )
+    parts.append("### Heuristic 3: Linear Conflict\n")
+    parts.append(
+        "Combines Manhattan distance with a penalty for linear conflicts. A linear conflict occurs when two tiles are in their goal row/column but in the wrong order.\n\n"
+    )
+
+    parts.append("### Heuristic 4: Pattern Database\n")
+    parts.append(
+        "Splits the tiles into disjoint groups and adds up, for each group, the precomputed fewest moves of its tiles needed to bring them home.\n\n"
+    )
 
-        # Results for each algorithm and heuristic
-        # Get unique algorithms and heuristics from the keys
-        algorithms = set()
-        heuristics = set()
-
-        for key in results.keys():
-            if "-" in key:
-                algorithm, heuristic = key.rsplit("-", 1)
-                algorithms.add(algorithm)
-                heuristics.add(heuristic)
-
-        # Use the discovered algorithms and heuristics
-        for algorithm in algorithms:
-            f.write(f"## {algorithm.upper()} Search\n\n")
-
-            for heuristic in heuristics:
-                key = f"{algorithm}-{heuristic}"
-                if key not in results:
-                    continue
-
-                experiments = results[key]
-                f.write(f"### Heuristic: {heuristic}\n\n")
-
-                # Calculate average steps
-                successful_experiments = [
-                    exp for exp in experiments if exp["solution_found"]
-                ]
-                if successful_experiments:
-                    avg_steps = sum(
-                        exp["solution_length"] for exp in successful_experiments
-                    ) / len(successful_experiments)
-                    f.write(f"Average number of steps: {avg_steps:.2f}\n\n")
+    # Results for each algorithm and heuristic
+    # Get unique algorithms and heuristics from the keys
+    algorithms = set()
+    heuristics = set()
+
+    for key in results.keys():
+        if "-" in key:
+            algorithm, heuristic = key.rsplit("-", 1)
+            algorithms.add(algorithm)
+            heuristics.add(heuristic)
+
+    # Use the discovered algorithms and heuristics
+    for algorithm in algorithms:
+        parts.append(f"## {algorithm.upper()} Search\n\n")
+
+        for heuristic in heuristics:
+            key = f"{algorithm}-{heuristic}"
+            if key not in results:
+                continue
+
+            experiments = results[key]
+            parts.append(f"### Heuristic: {heuristic}\n\n")
+
+            # Calculate average steps
+            successful_experiments = [
+                exp for exp in experiments if exp["solution_found"]
+            ]
+            if successful_experiments:
+                avg_steps = sum(
+                    exp["solution_length"] for exp in successful_experiments
+                ) / len(successful_experiments)
+                parts.append(f"Average number of steps: {avg_steps:.2f}\n\n")
+            else:
+                parts.append("No successful solutions found.\n\n")
+
+            # Write individual experiment results
+            for i, exp in enumerate(experiments):
+                parts.append(f"#### Initial state {i+1}: {exp['initial_state']}\n")
+                if exp["solution_found"]:
+                    parts.append(f"Solution found in {exp['solution_length']} steps\n\n")
+                    parts.append(
+                        f"Solution path:\n```\n{format_path(exp['solution_path'])}\n```\n\n"
+                    )
                 else:
-                    f.write("No successful solutions found.\n\n")
-
-                # Write individual experiment results
-                for i, exp in enumerate(experiments):
-                    f.write(f"#### Initial state {i+1}: {exp['initial_state']}\n")
-                    if exp["solution_found"]:
-                        f.write(f"Solution found in {exp['solution_length']} steps\n\n")
-                        f.write(
-                            f"Solution path:\n```\n{exp['formatted_path']}\n```\n\n"
-                        )
-                    else:
-                        f.write("No solution found within the step limit.\n\n")
-                    f.write(f"Nodes expanded: {exp['nodes_expanded']}\n")
-                    f.write(f"Nodes generated: {exp['nodes_generated']}\n")
-                    f.write(f"Time taken: {exp['time']:.3f} seconds\n\n")
+                    parts.append("No solution found within the step limit.\n\n")
+                parts.append(f"Nodes expanded: {exp['nodes_expanded']}\n")
+                parts.append(f"Nodes generated: {exp['nodes_generated']}\n")
+                parts.append(f"Time taken: {exp['time']:.3f} seconds\n\n")
+
+    with open(output_path, "w" if size == 3 else "a", buffering=1 << 16) as f:
+        f.write("".join(parts))
 
 
 def main():
     parser = argparse.ArgumentParser(description="Puzzle Solver (8-puzzle or 15-puzzle)")
     parser.add_argument(
-        "--algorithm", choices=["best-first", "astar"], help="Search algorithm to use"
+        "--algorithm",
+        choices=["best-first", "astar", "idastar", "bi-astar"],
+        help="Search algorithm to use",
     )
     parser.add_argument(
         "--heuristic",
-        choices=["misplaced", "manhattan", "linear_conflict"],
+        choices=["misplaced", "manhattan", "linear_conflict", "pdb"],
         help="Heuristic function to use",
     )
     parser.add_argument(
@@ -338,7 +414,7 @@ def main():
         print(f"\nInitial state: {result['initial_state']}")
         if result["solution_found"]:
             print(f"Solution found in {result['solution_length']} steps")
-            print(f"Solution path: {result['formatted_path']}")
+            print(f"Solution path: {format_path(result['solution_path'])}")
         else:
             print("No solution found within the step limit.")
         print(f"Nodes expanded: {result['nodes_expanded']}")
@@ -0,0 +1,33 @@
+import functools
+from typing import Callable
+
+from ..puzzle import Puzzle
+
+# Upper bound on cached entries per heuristic. A full cache costs on the
+# order of 100 MB (key int plus dict slot per entry) and lives as long as
+# the process, so it is dropped wholesale rather than grown further.
+CACHE_LIMIT = 1 << 20
+
+
+def memoize_by_packed(heuristic: Callable[[Puzzle], int]) -> Callable[[Puzzle], int]:
+    """
+    Memoize a heuristic by packed state, with a bounded cache.
+
+    Searches regenerate the same states through different parents, and IDA*
+    re-expands them on every iteration, so repeated lookups are common for
+    heuristics that need a board scan. The cache is cleared once it holds
+    CACHE_LIMIT entries.
+    """
+    cache = {}
+
+    @functools.wraps(heuristic)
+    def wrapper(puzzle: Puzzle) -> int:
+        key = puzzle.packed
+        h = cache.get(key)
+        if h is None:
+            if len(cache) >= CACHE_LIMIT:
+                cache.clear()
+            h = cache[key] = heuristic(puzzle)
+        return h
+
+    return wrapper
@@ -1,4 +1,36 @@
-from ..puzzle import Puzzle
+from operator import getitem
+from typing import Callable, Sequence
+
+from ..puzzle import Puzzle, TILE_DISTANCES
+
+# Goal (row, col) of every tile, per puzzle width. Tile N belongs at index
+# N - 1; the blank (0) belongs in the last cell.
+GOAL_RC = {
+    size: tuple(divmod((tile - 1) % (size * size), size) for tile in range(size * size))
+    for size in (3, 4)
+}
+
+
+def _make_manhattan(size: int) -> Callable[[Sequence[int]], int]:
+    """
+    Build a Manhattan distance kernel specialized for one puzzle width.
+
+    The distance of every tile from every cell is precomputed in
+    TILE_DISTANCES[size][pos][tile] (0 for the blank), so the kernel is a
+    single C-level pass that looks each cell's tile up in its row of the
+    table and sums the results. It only touches plain integers and can be
+    called on any flat sequence of tiles without the Puzzle wrapper.
+    """
+    distances = TILE_DISTANCES[size]
+
+    def kernel(state: Sequence[int]) -> int:
+        return sum(map(getitem, distances, state))
+
+    return kernel
+
+
+# Hot kernels behind manhattan_distance, one per puzzle width
+_MANHATTAN_KERNELS = {size: _make_manhattan(size) for size in (3, 4)}
 
 
 def manhattan_distance(puzzle: Puzzle) -> int:
@@ -9,32 +41,18 @@ def manhattan_distance(puzzle: Puzzle) -> int:
     of Manhattan distances (|x1 - x2| + |y1 - y2|) for each tile from its current
     position to its goal position (excluding the blank).
 
+    The value is cached on the puzzle, and children generated from it
+    (apply_move, iter_children) inherit an incrementally updated value, so
+    along a search only the root is scanned in full.
+
     Args:
         puzzle: The current puzzle state
 
     Returns:
         The sum of Manhattan distances
     """
-    size = puzzle.size
-    total_distance = 0
-
-    # For each tile, calculate its Manhattan distance to its goal position
-    for i, tile in enumerate(puzzle.state):
-        if tile == 0:  # Skip the blank
-            continue
-
-        # Current position
-        current_row = i // size
-        current_col = i % size
-
-        # Goal position: for tile N, it should be at index (N-1)
-        goal_idx = tile - 1
-        goal_row = goal_idx // size
-        goal_col = goal_idx % size
-
-        # Calculate Manhattan distance: |row1 - row2| + |col1 - col2|
-        distance = abs(current_row - goal_row) + abs(current_col - goal_col)
-
-        total_distance += distance
+    distance = puzzle._manhattan
+    if distance is None:
+        distance = puzzle._manhattan = _MANHATTAN_KERNELS[puzzle.size](puzzle.state)
+    return distance
 
-    return total_distance
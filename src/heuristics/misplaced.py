@@ -1,4 +1,34 @@
-from ..puzzle import Puzzle
+from operator import ne
+from typing import Callable, Sequence
+
+from ..puzzle import Puzzle, GOAL_STATES
+
+
+def _make_misplaced(size: int) -> Callable[[Sequence[int]], int]:
+    """Build a misplaced-tiles kernel with the goal state of one puzzle width bound in."""
+    goal = GOAL_STATES[size]
+
+    def kernel(state: Sequence[int]) -> int:
+        # Count mismatched cells in a single C-level pass. When the blank is
+        # out of place its own cell is one of the mismatches, so take it back out.
+        return sum(map(ne, state, goal)) - (state[-1] != 0)
+
+    return kernel
+
+
+# Per-tile form of the heuristic, per puzzle width: 1 if the tile is out of
+# place at that position, 0 otherwise (always 0 for the blank), indexed
+# [pos][tile]. Searches working on packed states sum these directly.
+TILE_MISPLACED = {
+    size: tuple(
+        tuple(int(tile != 0 and tile != goal[pos]) for tile in range(size * size))
+        for pos in range(size * size)
+    )
+    for size, goal in GOAL_STATES.items()
+}
+
+# Hot kernels behind misplaced_tiles, one per puzzle width
+_MISPLACED_KERNELS = {size: _make_misplaced(size) for size in (3, 4)}
 
 
 def misplaced_tiles(puzzle: Puzzle) -> int:
@@ -14,13 +44,4 @@ def misplaced_tiles(puzzle: Puzzle) -> int:
     Returns:
         The number of misplaced tiles
     """
-    # Generate the goal state based on puzzle size
-    size_squared = puzzle.size * puzzle.size
-    goal_state = list(range(1, size_squared)) + [0]
-    count = 0
-
-    for i, tile in enumerate(puzzle.state):
-        if tile != 0 and tile != goal_state[i]:
-            count += 1
-
-    return count
+    return _MISPLACED_KERNELS[puzzle.size](puzzle.state)
@@ -1,33 +1,40 @@
-from dataclasses import dataclass, field
-from typing import Optional, List, Callable, Any
+from collections import deque
+from typing import Optional, List, Callable, Iterator, Tuple
 from .puzzle import Puzzle
 
 
-@dataclass
 class Node:
     """Represents a node in the search tree."""
 
-    # The puzzle state at this node
-    state: Puzzle
-
-    # Cost to reach this node from the start (g value)
-    cost: int = 0
-
-    # Heuristic value (h value)
-    heuristic: int = 0
-
-    # Parent node
-    parent: Optional["Node"] = None
-
-    # Move that led to this state from the parent
-    move: Optional[str] = None
-
-    # Total estimated cost (f = g + h)
-    total_cost: int = field(init=False)
+    # Search trees hold a great many nodes, so skip the per-instance __dict__
+    __slots__ = ("state", "cost", "heuristic", "parent", "move", "total_cost")
+
+    def __init__(
+        self,
+        state: Puzzle,
+        cost: int = 0,
+        heuristic: int = 0,
+        parent: Optional["Node"] = None,
+        move: Optional[str] = None,
+    ):
+        """
+        Initialize a search node.
+
+        Args:
+            state: The puzzle state at this node
+            cost: Cost to reach this node from the start (g value)
+            heuristic: Heuristic value (h value)
+            parent: Parent node
+            move: Move that led to this state from the parent
+        """
+        self.state = state
+        self.cost = cost
+        self.heuristic = heuristic
+        self.parent = parent
+        self.move = move
 
-    def __post_init__(self):
-        """Calculate the total cost after initialization."""
-        self.total_cost = self.cost + self.heuristic
+        # Total estimated cost (f = g + h)
+        self.total_cost = cost + heuristic
 
     def __lt__(self, other):
         """Compare nodes based on total cost for priority queue."""
@@ -47,12 +54,13 @@ class Node:
 
     def get_path(self) -> List["Node"]:
         """Get the path from the start node to this node."""
-        path = []
+        # Build in start-to-goal order directly rather than reversing a copy
+        path = deque()
         current = self
         while current:
-            path.append(current)
+            path.appendleft(current)
             current = current.parent
-        return path[::-1]  # Reverse to get start-to-goal path
+        return list(path)
 
     def get_solution_path(self) -> List[List[int]]:
         """Get the solution path as a list of puzzle states.
@@ -62,7 +70,13 @@ class Node:
             Note: The length of this list is the number of states, not the number of moves.
             The number of moves is len(solution_path) - 1.
         """
-        return [node.state.state for node in self.get_path()]
+        # Collect the states directly, without an intermediate list of nodes
+        path = deque()
+        current = self
+        while current:
+            path.appendleft(list(current.state.state))
+            current = current.parent
+        return list(path)
 
     def get_moves_path(self) -> List[str]:
         """Get the sequence of moves from the start to this node."""
@@ -73,23 +87,112 @@ class Node:
         """Get the total cost of the path to this node."""
         return self.cost
 
-    def expand(self, heuristic_func: Callable[[Puzzle], int]) -> List["Node"]:
-        """Expand the node by generating all possible child nodes."""
-        children = []
-
-        for move in self.state.get_legal_moves():
-            # Apply the move to get a new state
-            new_state = self.state.apply_move(move)
-
-            # Create a child node
-            child = Node(
+    def expand(self, heuristic_func: Callable[[Puzzle], int]) -> Iterator["Node"]:
+        """Expand the node, lazily generating all possible child nodes."""
+        for move, new_state, heuristic in successors(self.state, heuristic_func):
+            yield Node(
                 state=new_state,
                 cost=self.cost + 1,  # Increment cost by 1
-                heuristic=heuristic_func(new_state),
+                heuristic=heuristic,
                 parent=self,
                 move=move,
             )
 
-            children.append(child)
 
-        return children
+def successors(
+    state: Puzzle, heuristic_func: Callable[[Puzzle], int]
+) -> Iterator[Tuple[str, Puzzle, int]]:
+    """
+    Generate (move, child_state, child_heuristic) for every legal move from state.
+
+    Children come from Puzzle.iter_children, which carries the parent's
+    cached Manhattan distance over to each child in O(1), so Manhattan-based
+    heuristics do not rescan the board for every child.
+
+    Args:
+        state: The puzzle state to expand
+        heuristic_func: The heuristic function to use
+
+    Returns:
+        An iterator over the children of state
+    """
+    for move, new_state in state.iter_children():
+        yield move, new_state, heuristic_func(new_state)
+
+
+class NodeArena:
+    """
+    Flat store of search nodes, addressed by integer index.
+
+    Instead of one Node object per search node, the fields live in parallel
+    lists (structure of arrays) and parents are referenced by index, with -1
+    for the root. Searches keep plain integers in their queues and only build
+    Node objects for the final solution path.
+    """
+
+    __slots__ = ("states", "costs", "heuristics", "parents", "moves")
+
+    def __init__(self):
+        """Create an empty arena."""
+        self.states: List[Puzzle] = []
+        self.costs: List[int] = []
+        self.heuristics: List[int] = []
+        self.parents: List[int] = []
+        self.moves: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        """Number of nodes stored in the arena."""
+        return len(self.states)
+
+    def add(
+        self,
+        state: Puzzle,
+        cost: int = 0,
+        heuristic: int = 0,
+        parent: int = -1,
+        move: Optional[str] = None,
+    ) -> int:
+        """Append a node and return its index."""
+        self.states.append(state)
+        self.costs.append(cost)
+        self.heuristics.append(heuristic)
+        self.parents.append(parent)
+        self.moves.append(move)
+        return len(self.states) - 1
+
+    def expand(
+        self, index: int, heuristic_func: Callable[[Puzzle], int]
+    ) -> Iterator[Tuple[str, Puzzle, int]]:
+        """
+        Generate (move, child_state, child_heuristic) for the node at index.
+
+        Children are not stored; the caller adds the ones it keeps, so states
+        that are discarded (e.g. already closed) never take up a slot.
+        """
+        return successors(self.states[index], heuristic_func)
+
+    def get_solution_path(self, index: int) -> List[List[int]]:
+        """Get the puzzle states from the root to the node at index (inclusive)."""
+        path = deque()
+        while index != -1:
+            path.appendleft(list(self.states[index].state))
+            index = self.parents[index]
+        return list(path)
+
+    def to_node(self, index: int) -> Node:
+        """Build the chain of Node objects from the root to the node at index."""
+        indices = []
+        while index != -1:
+            indices.append(index)
+            index = self.parents[index]
+
+        node = None
+        for i in reversed(indices):
+            node = Node(
+                state=self.states[i],
+                cost=self.costs[i],
+                heuristic=self.heuristics[i],
+                parent=node,
+                move=self.moves[i],
+            )
+        return node
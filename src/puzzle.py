@@ -1,36 +1,196 @@
-from typing import List, Tuple, Optional, Set
-import copy
+from typing import Iterator, List, Tuple, Optional, Set, Sequence
 import random
 
 
+def _build_legal_moves(size: int) -> Tuple[Tuple[Tuple[str, int], ...], ...]:
+    """
+    For every blank position, list the legal moves as (move, swap_pos) pairs,
+    where swap_pos is the index the blank swaps with.
+    """
+    table = []
+    for blank_pos in range(size * size):
+        row, col = divmod(blank_pos, size)
+        moves = []
+        if row > 0:
+            moves.append(("up", blank_pos - size))
+        if row < size - 1:
+            moves.append(("down", blank_pos + size))
+        if col > 0:
+            moves.append(("left", blank_pos - 1))
+        if col < size - 1:
+            moves.append(("right", blank_pos + 1))
+        table.append(tuple(moves))
+    return tuple(table)
+
+
+# Legal (move, swap_pos) pairs per puzzle width, indexed by blank position
+LEGAL_MOVES = {size: _build_legal_moves(size) for size in (3, 4)}
+
+# Legal move names per puzzle width, indexed by blank position
+MOVE_NAMES = {
+    size: tuple(tuple(move for move, _ in moves) for moves in table)
+    for size, table in LEGAL_MOVES.items()
+}
+
+# Swap targets per puzzle width, indexed by blank position then move name
+SWAP_TARGETS = {
+    size: tuple(dict(moves) for moves in table) for size, table in LEGAL_MOVES.items()
+}
+
+
+def _build_tile_distances(
+    size: int, target: Optional[Sequence[int]] = None
+) -> Tuple[Tuple[int, ...], ...]:
+    """
+    For every board index, the Manhattan distance of each tile placed there
+    from its cell in target (0 for the blank), indexed [pos][tile].
+
+    target defaults to the goal state, where tile N belongs at index N - 1.
+    """
+    n = size * size
+    target_pos = list(range(-1, n - 1))
+    if target is not None:
+        for pos, tile in enumerate(target):
+            target_pos[tile] = pos
+
+    table = []
+    for pos in range(n):
+        row, col = divmod(pos, size)
+        distances = [0]
+        for tile in range(1, n):
+            target_row, target_col = divmod(target_pos[tile], size)
+            distances.append(abs(row - target_row) + abs(col - target_col))
+        table.append(tuple(distances))
+    return tuple(table)
+
+
+# Per-tile Manhattan distances per puzzle width, indexed by position then tile
+TILE_DISTANCES = {size: _build_tile_distances(size) for size in (3, 4)}
+
+
+def _build_expansions(size: int) -> Tuple[Tuple[Tuple[str, int, int, Tuple[int, ...]], ...], ...]:
+    """
+    For every blank position, precompute what iter_children needs per move:
+    (move, swap_pos, nibble_mask, manhattan_deltas).
+
+    nibble_mask has a 1 in the lowest bit of the two nibbles that change, so
+    a child's packed state is the parent's XOR tile * nibble_mask.
+    manhattan_deltas[tile] is the change in Manhattan distance when that tile
+    slides from swap_pos into the blank's cell.
+    """
+    distances = TILE_DISTANCES[size]
+    table = []
+    for blank_pos, moves in enumerate(LEGAL_MOVES[size]):
+        entries = []
+        for move, swap_pos in moves:
+            nibble_mask = (1 << (4 * swap_pos)) | (1 << (4 * blank_pos))
+            deltas = tuple(
+                to_dist - from_dist
+                for to_dist, from_dist in zip(distances[blank_pos], distances[swap_pos])
+            )
+            entries.append((move, swap_pos, nibble_mask, deltas))
+        table.append(tuple(entries))
+    return tuple(table)
+
+
+# iter_children's per-move tables per puzzle width, indexed by blank position
+EXPANSIONS = {size: _build_expansions(size) for size in (3, 4)}
+
+
+def _inversion_parity(tiles: Sequence[int]) -> int:
+    """
+    Parity (0 or 1) of the number of pairs (i, j) with i < j and tiles[i] > tiles[j].
+
+    tiles must hold the numbers 1..N in some order. The inversion count of a
+    permutation has the same parity as the permutation itself, which is
+    N minus its number of cycles, so one O(N) walk over the cycles replaces
+    counting the inversions.
+    """
+    seen = bytearray(len(tiles) + 1)
+    cycles = 0
+    for start in tiles:
+        if not seen[start]:
+            cycles += 1
+            tile = start
+            while not seen[tile]:
+                seen[tile] = 1
+                tile = tiles[tile - 1]
+    return (len(tiles) - cycles) & 1
+
+
+# Goal state per puzzle width: tiles in order, blank in the last cell
+GOAL_STATES = {size: bytes(range(1, size * size)) + b"\x00" for size in (3, 4)}
+
+# Packed form of each goal state (see Puzzle.packed)
+GOAL_PACKED = {
+    size: sum(tile << (4 * i) for i, tile in enumerate(goal))
+    for size, goal in GOAL_STATES.items()
+}
+
+
 class Puzzle:
     """Represents the 8-puzzle state and operations."""
 
-    def __init__(self, state: List[int]):
+    def __init__(
+        self,
+        state: Sequence[int],
+        packed: Optional[int] = None,
+        blank_pos: Optional[int] = None,
+        _trusted: bool = False,
+    ):
         """
         Initialize a puzzle with the given state.
-        State is a list of integers where 0 represents the blank space.
-        Can be 9 elements (3×3) or 16 elements (4×4) for 8-puzzle or 15-puzzle respectively.
-        """
-        # Determine the size based on state length
-        if len(state) == 9:
-            self.size = 3  # 3×3 grid (8-puzzle)
-            max_value = 8
-        elif len(state) == 16:
-            self.size = 4  # 4×4 grid (15-puzzle)
-            max_value = 15
+        State is a sequence of integers (e.g. a list or bytes) where 0 represents
+        the blank space. Can be 9 elements (3×3) or 16 elements (4×4) for 8-puzzle
+        or 15-puzzle respectively.
+
+        The state is stored as an immutable bytes object, one byte per tile, so
+        copying it is a memcpy and comparing it a memcmp.
+
+        The state is also kept packed into a single integer, 4 bits per tile
+        with index i at bits 4*i..4*i+3. Callers that already know the packed
+        value (e.g. apply_move) can pass it in to skip recomputing it. The
+        same goes for blank_pos, the index of the blank.
+
+        _trusted is for internal callers only: the state must be a bytes
+        object derived from an already validated puzzle (apply_move,
+        iter_children), and validation is skipped.
+        """
+        if _trusted:
+            # A move only permutes the tiles of a valid board, so the result is valid
+            self.size = 3 if len(state) == 9 else 4
         else:
-            raise ValueError("State must have exactly 9 elements (8-puzzle) or 16 elements (15-puzzle)")
+            # Determine the size based on state length
+            if len(state) == 9:
+                self.size = 3  # 3×3 grid (8-puzzle)
+                max_value = 8
+            elif len(state) == 16:
+                self.size = 4  # 4×4 grid (15-puzzle)
+                max_value = 15
+            else:
+                raise ValueError("State must have exactly 9 elements (8-puzzle) or 16 elements (15-puzzle)")
+
+            # Check that state contains exactly the numbers 0 through max_value
+            expected_values = list(range(len(state)))
+            if sorted([x for x in state if x >= 0 and x <= max_value]) != expected_values:
+                raise ValueError(f"State must contain exactly the numbers 0-{max_value}")
 
-        # Check that state contains exactly the numbers 0 through max_value
-        expected_values = list(range(len(state)))
-        if sorted([x for x in state if x >= 0 and x <= max_value]) != expected_values:
-            raise ValueError(f"State must contain exactly the numbers 0-{max_value}")
+        self.state = state if type(state) is bytes else bytes(state)
 
-        self.state = state
+        # Pack the state into one integer for cheap hashing and comparison;
+        # the searches use it as the key of their open and closed sets
+        if packed is None:
+            packed = 0
+            for i, tile in enumerate(state):
+                packed |= tile << (4 * i)
+        self.packed = packed
 
-        # Find the blank position
-        self.blank_pos = self.state.index(0)
+        # Find the blank position unless the caller already knows it
+        self.blank_pos = self.state.index(0) if blank_pos is None else blank_pos
+
+        # Manhattan distance, once known. Children derive theirs from it in O(1)
+        # since a move only changes the position of one tile.
+        self._manhattan: Optional[int] = None
 
     @classmethod
     def from_string(cls, state_str: str) -> "Puzzle":
@@ -49,8 +209,9 @@ class Puzzle:
         String representation of the puzzle for display.
         """
         result = ""
-        for i in range(3):
-            row = self.state[i * 3 : (i + 1) * 3]
+        size = self.size
+        for i in range(size):
+            row = self.state[i * size : (i + 1) * size]
             result += " ".join(str(x) if x != 0 else "b" for x in row) + "\n"
         return result.strip()
 
@@ -60,13 +221,13 @@ class Puzzle:
         """
         if not isinstance(other, Puzzle):
             return False
-        return self.state == other.state
+        return self.packed == other.packed
 
     def __hash__(self) -> int:
         """
         Hash function for using Puzzle objects in sets and as dict keys.
         """
-        return hash(tuple(self.state))
+        return hash(self.packed)
 
     def get_blank_position(self) -> Tuple[int, int]:
         """
@@ -81,66 +242,47 @@ class Puzzle:
         Return a list of legal moves from the current state.
         Moves are represented as 'up', 'down', 'left', 'right'.
         """
-        row, col = self.get_blank_position()
-        moves = []
-
-        # Check if blank can move up
-        if row > 0:
-            moves.append("up")
-
-        # Check if blank can move down
-        if row < self.size - 1:
-            moves.append("down")
-
-        # Check if blank can move left
-        if col > 0:
-            moves.append("left")
-
-        # Check if blank can move right
-        if col < self.size - 1:
-            moves.append("right")
-
-        return moves
+        return list(MOVE_NAMES[self.size][self.blank_pos])
 
     def apply_move(self, move: str) -> "Puzzle":
         """
         Apply a move to the current state and return a new Puzzle instance.
         """
-        if move not in self.get_legal_moves():
+        # Look up the position to swap with the blank
+        swap_pos = SWAP_TARGETS[self.size][self.blank_pos].get(move)
+        if swap_pos is None:
             raise ValueError(f"Illegal move: {move}")
+        return self._swap_blank(swap_pos)
 
-        # Create a new state by copying the current one
-        new_state = copy.deepcopy(self.state)
-        row, col = self.get_blank_position()
-        blank_pos = row * self.size + col
-
-        # Calculate the position to swap with the blank
-        if move == "up":
-            swap_pos = blank_pos - self.size
-        elif move == "down":
-            swap_pos = blank_pos + self.size
-        elif move == "left":
-            swap_pos = blank_pos - 1
-        else:  # move == 'right'
-            swap_pos = blank_pos + 1
-
-        # Swap the blank with the appropriate tile
-        new_state[blank_pos], new_state[swap_pos] = (
-            new_state[swap_pos],
-            new_state[blank_pos],
-        )
-
-        return Puzzle(new_state)
+    def _swap_blank(self, swap_pos: int) -> "Puzzle":
+        """
+        Return the puzzle obtained by swapping the blank with the tile at swap_pos.
+        """
+        # Swap the blank with the appropriate tile in a mutable copy of the state
+        blank_pos = self.blank_pos
+        new_state = bytearray(self.state)
+        tile = new_state[swap_pos]
+        new_state[blank_pos], new_state[swap_pos] = tile, 0
+
+        # Only two nibbles change: the tile leaves swap_pos and lands on blank_pos
+        packed = self.packed ^ (tile << (4 * swap_pos)) ^ (tile << (4 * blank_pos))
+
+        child = Puzzle(bytes(new_state), packed, swap_pos, _trusted=True)
+        if self._manhattan is not None:
+            distances = TILE_DISTANCES[self.size]
+            child._manhattan = (
+                self._manhattan + distances[blank_pos][tile] - distances[swap_pos][tile]
+            )
+        return child
 
     def is_goal(self) -> bool:
         """
         Check if the current state is the goal state (tiles in order, blank at the end).
         Works for both 8-puzzle and 15-puzzle.
         """
-        # Create the goal state based on the puzzle size
-        size_squared = self.size * self.size
-        goal_state = list(range(1, size_squared)) + [0]
-        return self.state == goal_state
+        # The packed value identifies the state exactly, so one integer
+        # comparison against the precomputed goal replaces a board compare
+        return self.packed == GOAL_PACKED[self.size]
 
     def is_solvable(self) -> bool:
         """
@@ -154,36 +296,27 @@ class Puzzle:
         An inversion is when a tile with a higher number precedes a tile with a lower number
         in the linearized representation of the state (ignoring the blank/0).
         """
-        # Count inversions (excluding the blank)
-        tiles = [t for t in self.state if t != 0]  # Remove the blank
-        inversions = 0
-
-        for i in range(len(tiles)):
-            for j in range(i + 1, len(tiles)):
-                if tiles[i] > tiles[j]:
-                    inversions += 1
+        # Only the parity of the inversion count matters (excluding the blank)
+        inversions = _inversion_parity(self.state.replace(b"\x00", b""))
 
         # For 3×3 puzzle (8-puzzle)
         if self.size == 3:
-            return inversions % 2 == 0
+            return inversions == 0
         # For 4×4 puzzle (15-puzzle)
         elif self.size == 4:
-            # Calculate the row of the blank from the bottom (indexed 1-4 from bottom)
-            blank_row, _ = self.get_blank_position()
-            blank_row_from_bottom = self.size - blank_row
-            
-            # If blank is on an even row from bottom, inversions must be odd
-            if blank_row_from_bottom % 2 == 0:
-                return inversions % 2 == 1
-            # If blank is on an odd row from bottom, inversions must be even
-            else:
-                return inversions % 2 == 0
+            # With 4 rows, the blank's row from the bottom (1-4) is even exactly
+            # when its row from the top (0-3) is even, so both rules above reduce
+            # to: inversion parity and blank row (from the top) differ in parity
+            blank_row = self.blank_pos >> 2
+            return (inversions ^ blank_row) & 1 == 1
         else:
             raise ValueError(f"Unsupported puzzle size: {self.size}×{self.size}")
 
     def get_state_tuple(self) -> Tuple[int, ...]:
         """
         Return the state as a tuple for use in hashing.
+
+        The packed value is a cheaper key for the same purpose.
         """
         return tuple(self.state)
         
@@ -195,15 +328,33 @@ class Puzzle:
             A list of tuples, where each tuple contains the move direction
             ("up", "down", "left", "right") and the resulting Puzzle state.
         """
-        neighbors = []
-        legal_moves = self.get_legal_moves()
-        
-        # Generate all valid neighbor states by applying each legal move
-        for move in legal_moves:
-            neighbor = self.apply_move(move)
-            neighbors.append((move, neighbor))
-            
-        return neighbors
+        return list(self.iter_children())
+
+    def iter_children(self) -> Iterator[Tuple[str, "Puzzle"]]:
+        """
+        Lazily yield (move, child) for every legal move from this state.
+
+        This is the expansion path used by the searches: it walks the
+        precomputed (move, swap_pos) table for the blank's position and swaps
+        in place, with no intermediate move list and no lookup by move name.
+        If this state's Manhattan distance is known, each child's is derived
+        from it by the moved tile's change in distance.
+        """
+        state = self.state
+        packed = self.packed
+        blank_pos = self.blank_pos
+        manhattan = self._manhattan
+        for move, swap_pos, nibble_mask, deltas in EXPANSIONS[self.size][blank_pos]:
+            new_state = bytearray(state)
+            tile = new_state[swap_pos]
+            new_state[blank_pos], new_state[swap_pos] = tile, 0
+            # The blank ends up where the moved tile was
+            child = Puzzle(
+                bytes(new_state), packed ^ tile * nibble_mask, swap_pos, _trusted=True
+            )
+            if manhattan is not None:
+                child._manhattan = manhattan + deltas[tile]
+            yield move, child
 
     @staticmethod
     def generate_random_solvable(n: int, size: int = 3) -> List["Puzzle"]:
@@ -211,8 +362,8 @@ class Puzzle:
         Generate n distinct, solvable puzzle states through random shuffling.
 
         This method repeatedly shuffles a solved puzzle state until it has
-        generated n unique, solvable puzzle configurations. It uses the
-        is_solvable() method to check if a shuffled state is solvable.
+        generated n unique, solvable puzzle configurations. Shuffles that
+        is_solvable() rejects are repaired by swapping two tiles.
 
         Args:
             n: The number of distinct, solvable puzzles to generate
@@ -230,26 +381,30 @@ class Puzzle:
         if size not in [3, 4]:
             raise ValueError("Only puzzles of size 3 (8-puzzle) or 4 (15-puzzle) are supported")
 
-        # Create the goal state based on size
-        size_squared = size * size
-        goal_state = list(range(1, size_squared)) + [0]
-
         # Set to track unique puzzle states
         unique_states = set()
         result = []
 
         while len(result) < n:
             # Create a shuffled copy of the goal state
-            shuffled = goal_state.copy()
+            shuffled = list(GOAL_STATES[size])
             random.shuffle(shuffled)
 
             # Create a puzzle from the shuffled state
             puzzle = Puzzle(shuffled)
 
-            # Check if it's solvable and not already in our collection
-            state_tuple = puzzle.get_state_tuple()
-            if puzzle.is_solvable() and state_tuple not in unique_states:
-                unique_states.add(state_tuple)
+            # Swapping two non-blank tiles flips the inversion parity without
+            # moving the blank, so an unsolvable shuffle becomes solvable. This
+            # maps unsolvable boards one-to-one onto solvable ones, so the
+            # result is still uniform and no shuffle is rejected.
+            if not puzzle.is_solvable():
+                i, j = (2, 3) if 0 in shuffled[:2] else (0, 1)
+                shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
+                puzzle = Puzzle(shuffled)
+
+            # Check that it's not already in our collection
+            if puzzle.packed not in unique_states:
+                unique_states.add(puzzle.packed)
                 result.append(puzzle)
 
         return result
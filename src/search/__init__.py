@@ -41,9 +41,16 @@ class Search(ABC):
 # Import search algorithms for easy access
 from .best_first import BestFirstSearch
 from .astar import AStarSearch
+from .idastar import IDAStarSearch
+from .bi_astar import BiAStarSearch
 
 # Export classes
-__all__ = ["Search", "BestFirstSearch", "AStarSearch"]
+__all__ = ["Search", "BestFirstSearch", "AStarSearch", "IDAStarSearch", "BiAStarSearch"]
 
 # Map of algorithm names to classes for easy lookup
-SEARCH_ALGORITHMS = {"best-first": BestFirstSearch, "astar": AStarSearch}
+SEARCH_ALGORITHMS = {
+    "best-first": BestFirstSearch,
+    "astar": AStarSearch,
+    "idastar": IDAStarSearch,
+    "bi-astar": BiAStarSearch,
+}
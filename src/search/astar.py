@@ -1,10 +1,11 @@
 from typing import List, Callable, Dict, Set, Optional, Tuple
-import heapq
 import time
 
 from . import Search
 from ..puzzle import Puzzle
-from ..node import Node
+from ..node import Node, NodeArena
+from .bucket_queue import BucketQueue
+from .packed import TILE_TABLES, packed_astar, path_to_node
 
 
 class AStarSearch(Search):
@@ -47,68 +48,155 @@ class AStarSearch(Search):
             self.execution_time = time.time() - start_time
             return Node(state=initial_state, heuristic=0)
 
+        # Heuristics made of independent per-tile terms run on packed integer
+        # states, without building Puzzle objects for every node
+        tables = TILE_TABLES.get(heuristic_func)
+        if tables is not None:
+            size = initial_state.size
+            blanks, self.nodes_expanded, self.nodes_generated = packed_astar(
+                initial_state.packed,
+                initial_state.blank_pos,
+                size,
+                tables[size],
+                self.max_steps,
+            )
+            self.execution_time = time.time() - start_time
+            if blanks is None:
+                return None
+            return path_to_node(initial_state, blanks, heuristic_func)
+
+        # Search nodes live in a flat arena; the queue only holds their indices
+        arena = NodeArena()
+
         # Initialize the open list (priority queue) with the initial node
         initial_h = heuristic_func(initial_state)
-        initial_node = Node(state=initial_state, cost=0, heuristic=initial_h)
+        initial_index = arena.add(initial_state, cost=0, heuristic=initial_h)
         self.nodes_generated += 1
 
-        # In A*, the priority is f = g + h
-        open_list = [
-            (initial_node.total_cost, 0, initial_node)
-        ]  # (f, tie_breaker, node)
+        # In A*, the priority is f = g + h. f-values are small integers, so the
+        # open list is a bucket queue of node indices rather than a binary heap.
+        open_list = BucketQueue()
+        open_list.push(initial_h, initial_index)
         open_dict = {
-            initial_state.get_state_tuple(): initial_node
-        }  # For efficient lookup and updates
-
-        # Keep track of visited states to avoid cycles
-        closed_set = set()
-
-        # Counter for tie-breaking when f values are equal
-        counter = 1
+            initial_state.packed: 0
+        }  # Best g-value per open state, for efficient lookup and updates
 
         # Main search loop
-        while open_list and self.nodes_expanded < self.max_steps:
-            # Get the node with the lowest f value
-            _, _, current_node = heapq.heappop(open_list)
-            
-            # Check if this is the goal state immediately after popping
-            if current_node.state.is_goal():
-                self.execution_time = time.time() - start_time
-                return current_node
-            
-            state_tuple = current_node.state.get_state_tuple()
-
-            # Remove from open_dict if this is the best path to this state
-            if state_tuple in open_dict and open_dict[state_tuple] == current_node:
-                del open_dict[state_tuple]
-            else:
-                # We've found a better path to this state already
-                continue
-
-            # Add the current state to the closed set
-            closed_set.add(state_tuple)
+        goal_index, expanded, generated = _astar_loop(
+            arena, open_list, open_dict, heuristic_func, self.max_steps
+        )
+        self.nodes_expanded += expanded
+        self.nodes_generated += generated
+        if goal_index is not None:
+            self.execution_time = time.time() - start_time
+            return arena.to_node(goal_index)
 
-            # Expand the current node only if it's not a goal state
-            self.nodes_expanded += 1
-            for child_node in current_node.expand(heuristic_func):
-                self.nodes_generated += 1
-                child_state_tuple = child_node.state.get_state_tuple()
+        # If we get here, no solution was found within the step limit
+        self.execution_time = time.time() - start_time
+        return None
 
-                # Skip if we've already processed this state
-                if child_state_tuple in closed_set:
-                    continue
 
-                # Check if this state is already in the open list with a better path
-                if child_state_tuple in open_dict:
-                    existing_node = open_dict[child_state_tuple]
-                    if existing_node.cost <= child_node.cost:
-                        continue
+def _astar_loop(
+    arena: NodeArena,
+    open_list: BucketQueue,
+    open_dict: Dict[int, int],
+    heuristic_func: Callable[[Puzzle], int],
+    max_steps: int,
+) -> Tuple[Optional[int], int, int]:
+    """
+    Run the A* main loop until the goal is popped or max_steps nodes are expanded.
+
+    Kept apart from AStarSearch.search so the hot loop only touches locals:
+    the counters are plain integers instead of attributes on the search
+    object, the arena's lists and the queue's methods are bound once, and
+    children come straight from Puzzle.iter_children with arena slots
+    appended inline.
+
+    Args:
+        arena: Arena holding the initial node
+        open_list: Queue holding the initial node's index
+        open_dict: Best g-value per open state, holding the initial state
+        heuristic_func: The heuristic function to use
+        max_steps: Maximum number of nodes to expand
+
+    Returns:
+        (index of the goal node or None, nodes expanded, nodes generated)
+    """
+    states = arena.states
+    costs = arena.costs
+    add_state = states.append
+    add_cost = costs.append
+    add_heuristic = arena.heuristics.append
+    add_parent = arena.parents.append
+    add_move = arena.moves.append
+    push = open_list.push
+    pop = open_list.pop
+    pushpop = open_list.pushpop
+    get_best_g = open_dict.get
+
+    # Keep track of visited states to avoid cycles
+    closed_set = set()
+    close = closed_set.add
+
+    expanded = 0
+    generated = 0
+
+    # The last child of each expansion is held back and pushed together with
+    # the next pop; when its f is already the lowest it skips the queue
+    pending_f = pending = None
+
+    while (open_list or pending is not None) and expanded < max_steps:
+        # Get the node with the lowest f value
+        if pending is None:
+            current_index = pop()
+        else:
+            current_index = pushpop(pending_f, pending)
+            pending = None
+        current_state = states[current_index]
+
+        # Check if this is the goal state immediately after popping
+        if current_state.is_goal():
+            return current_index, expanded, generated
+
+        state_key = current_state.packed
+
+        # Entries superseded by a cheaper path, or whose state was already
+        # expanded, are stale; compare g-values instead of node identity
+        best_g = get_best_g(state_key)
+        if best_g is None or costs[current_index] > best_g:
+            continue
+        del open_dict[state_key]
+
+        # Add the current state to the closed set
+        close(state_key)
+
+        # Expand the current node only if it's not a goal state
+        expanded += 1
+        child_cost = costs[current_index] + 1
+        for move, child_state in current_state.iter_children():
+            generated += 1
+            child_key = child_state.packed
+
+            # Skip if we've already processed this state
+            if child_key in closed_set:
+                continue
 
-                # Add or update child in the open list
-                open_dict[child_state_tuple] = child_node
-                heapq.heappush(open_list, (child_node.total_cost, counter, child_node))
-                counter += 1
+            # Check if this state is already in the open list with a better path
+            best_g = get_best_g(child_key)
+            if best_g is not None and best_g <= child_cost:
+                continue
 
-        # If we get here, no solution was found within the step limit
-        self.execution_time = time.time() - start_time
-        return None
+            # Add or update child in the open list
+            child_h = heuristic_func(child_state)
+            child_index = len(states)
+            add_state(child_state)
+            add_cost(child_cost)
+            add_heuristic(child_h)
+            add_parent(current_index)
+            add_move(move)
+            open_dict[child_key] = child_cost
+            if pending is not None:
+                push(pending_f, pending)
+            pending_f, pending = child_cost + child_h, child_index
+
+    return None, expanded, generated
@@ -4,7 +4,7 @@ import time
 
 from . import Search
 from ..puzzle import Puzzle
-from ..node import Node
+from ..node import Node, NodeArena
 
 
 class BestFirstSearch(Search):
@@ -46,57 +46,75 @@ class BestFirstSearch(Search):
             self.execution_time = time.time() - start_time
             return Node(state=initial_state, heuristic=0)
 
+        # Search nodes live in a flat arena; the queue only holds their indices
+        arena = NodeArena()
+
         # Initialize the open list (priority queue) with the initial node
         # For best-first search, priority is based solely on heuristic value
         initial_h = heuristic_func(initial_state)
-        initial_node = Node(state=initial_state, cost=0, heuristic=initial_h)
+        initial_index = arena.add(initial_state, cost=0, heuristic=initial_h)
         self.nodes_generated += 1
 
         # In best-first search, the priority is only the heuristic value, not g + h
         # So we need a custom priority queue that uses only h as the priority
-        open_list = [(initial_h, 0, initial_node)]  # (h, tie_breaker, node)
-        open_set = {initial_state.get_state_tuple()}  # For efficient membership testing
+        # Arena indices are unique and increase with every push, so they double
+        # as the FIFO tie-breaker and Node.__lt__ is never reached
+        # States may be pushed more than once; copies popped after the state was
+        # expanded are skipped (lazy deletion), so no open-set bookkeeping is needed
+        open_list = [(initial_h, initial_index)]  # (h, node index)
 
         # Keep track of visited states to avoid cycles
         closed_set = set()
 
-        # Counter for tie-breaking when heuristic values are equal
-        counter = 1
+        states = arena.states
+        costs = arena.costs
+
+        # The last child of each expansion is held back and pushed together with
+        # the next pop in a single heappushpop call
+        pending = None
 
         # Main search loop
-        while open_list and self.nodes_expanded < self.max_steps:
+        while (open_list or pending) and self.nodes_expanded < self.max_steps:
             # Get the node with the lowest heuristic value
-            _, _, current_node = heapq.heappop(open_list)
-            state_tuple = current_node.state.get_state_tuple()
-            open_set.remove(state_tuple)
+            if pending is None:
+                _, current_index = heapq.heappop(open_list)
+            else:
+                _, current_index = heapq.heappushpop(open_list, pending)
+                pending = None
+            current_state = states[current_index]
+            state_key = current_state.packed
+
+            # Skip stale copies of states that were already expanded
+            if state_key in closed_set:
+                continue
 
             # Check if this is the goal state
-            if current_node.state.is_goal():
+            if current_state.is_goal():
                 self.execution_time = time.time() - start_time
-                return current_node
+                return arena.to_node(current_index)
 
             # Add the current state to the closed set
-            closed_set.add(state_tuple)
+            closed_set.add(state_key)
 
             # Expand the current node
             self.nodes_expanded += 1
-            for child_node in current_node.expand(heuristic_func):
+            child_cost = costs[current_index] + 1
+            for move, child_state, child_h in arena.expand(current_index, heuristic_func):
                 self.nodes_generated += 1
-                child_state_tuple = child_node.state.get_state_tuple()
+                child_key = child_state.packed
 
                 # Skip if we've already processed this state
-                if child_state_tuple in closed_set:
-                    continue
-
-                # Skip if this state is already in the open list
-                if child_state_tuple in open_set:
+                if child_key in closed_set:
                     continue
 
                 # Add child to the open list
                 # For best-first search, we only care about the heuristic value
-                heapq.heappush(open_list, (child_node.heuristic, counter, child_node))
-                open_set.add(child_state_tuple)
-                counter += 1
+                child_index = arena.add(
+                    child_state, child_cost, child_h, current_index, move
+                )
+                if pending is not None:
+                    heapq.heappush(open_list, pending)
+                pending = (child_h, child_index)
 
         # If we get here, no solution was found within the step limit
         self.execution_time = time.time() - start_time
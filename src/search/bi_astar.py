@@ -0,0 +1,194 @@
+from operator import getitem
+from typing import Callable, Dict, List, Optional, Tuple
+import heapq
+import math
+import time
+
+from . import Search
+from ..puzzle import Puzzle, GOAL_STATES, _build_tile_distances
+from ..node import Node, NodeArena
+
+# Move that undoes each move, for replaying the backward half of a path
+OPPOSITE_MOVES = {"up": "down", "down": "up", "left": "right", "right": "left"}
+
+
+def _distance_to(target: Puzzle) -> Callable[[Puzzle], int]:
+    """
+    Build a Manhattan distance heuristic towards an arbitrary target state.
+
+    The heuristics in src.heuristics all measure the distance to the goal
+    state; the backward search needs one that measures the distance back to
+    the start. Its per-tile distance table is built once for the target, the
+    same way TILE_DISTANCES is for the goal.
+    """
+    distances = _build_tile_distances(target.size, target.state)
+
+    def heuristic(puzzle: Puzzle) -> int:
+        return sum(map(getitem, distances, puzzle.state))
+
+    return heuristic
+
+
+class BiAStarSearch(Search):
+    """Implementation of bidirectional A* Search algorithm."""
+
+    def search(
+        self, initial_state: Puzzle, heuristic_func: Callable[[Puzzle], int]
+    ) -> Optional[Node]:
+        """
+        Perform bidirectional A* search from the initial state.
+
+        Moves are reversible, so a second A* search can run backwards from
+        the goal while the first runs forward from the start. The forward
+        search is guided by heuristic_func; the backward one by the Manhattan
+        distance back to the start. At each step the side with the smaller
+        open list is expanded, and whenever a generated state has already
+        been reached by the other side, the cost of the joined path is a
+        candidate solution. The search stops once the best candidate costs no
+        more than the larger of the two sides' lowest f-values, which with
+        admissible heuristics bounds every path not yet found, so the
+        solution is optimal.
+
+        That bound needs every state on a cheaper path to come back to the
+        open list, so there is no closed set: a state is pushed again
+        (reopened, if it was already expanded) whenever a cheaper path to it
+        turns up. With consistent heuristics, which all of src.heuristics
+        are, an expanded state's cost is already optimal and this never
+        happens.
+
+        Args:
+            initial_state: The initial puzzle state
+            heuristic_func: The heuristic function to use
+
+        Returns:
+            The goal node if found, None otherwise
+        """
+        # Reset statistics
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.execution_time = 0
+
+        # Record start time
+        start_time = time.time()
+
+        # Check if the initial state is solvable
+        if not initial_state.is_solvable():
+            print("Warning: The puzzle is not solvable!")
+            self.execution_time = time.time() - start_time
+            return None
+
+        # Check if the initial state is already the goal state
+        if initial_state.is_goal():
+            self.execution_time = time.time() - start_time
+            return Node(state=initial_state, heuristic=0)
+
+        goal_state = Puzzle(GOAL_STATES[initial_state.size])
+
+        # One search per direction: [forward, backward]. Each keeps its nodes in
+        # an arena, an (f, index) heap, and the best node index reached per state.
+        heuristics = [heuristic_func, _distance_to(initial_state)]
+        arenas = [NodeArena(), NodeArena()]
+        open_lists: List[List[Tuple[int, int]]] = []
+        best: List[Dict[int, int]] = [{}, {}]
+        for side, root in enumerate((initial_state, goal_state)):
+            h = heuristics[side](root)
+            index = arenas[side].add(root, cost=0, heuristic=h)
+            open_lists.append([(h, index)])
+            best[side][root.packed] = index
+            self.nodes_generated += 1
+
+        # Cost of the best path found so far, and where its two halves meet
+        best_cost = math.inf
+        meeting = None
+        proven = False
+
+        while open_lists[0] and open_lists[1] and self.nodes_expanded < self.max_steps:
+            # Stop once no unexplored path can beat the best one found
+            if best_cost <= max(open_lists[0][0][0], open_lists[1][0][0]):
+                proven = True
+                break
+
+            # Expand on the side with the smaller frontier
+            side = 0 if len(open_lists[0]) <= len(open_lists[1]) else 1
+            other = 1 - side
+            arena = arenas[side]
+            costs = arena.costs
+            side_best = best[side]
+            other_best = best[other]
+            other_costs = arenas[other].costs
+
+            _, current_index = heapq.heappop(open_lists[side])
+            state_key = arena.states[current_index].packed
+
+            # Skip stale entries, superseded by a cheaper path
+            if side_best[state_key] != current_index:
+                continue
+
+            self.nodes_expanded += 1
+            child_cost = costs[current_index] + 1
+            for move, child_state, child_h in arena.expand(current_index, heuristics[side]):
+                self.nodes_generated += 1
+                child_key = child_state.packed
+
+                # Skip if this state was already reached at no greater cost
+                known = side_best.get(child_key)
+                if known is not None and costs[known] <= child_cost:
+                    continue
+
+                child_index = arena.add(
+                    child_state, child_cost, child_h, current_index, move
+                )
+                side_best[child_key] = child_index
+                heapq.heappush(open_lists[side], (child_cost + child_h, child_index))
+
+                # The other side has reached this state too: the halves join up
+                other_index = other_best.get(child_key)
+                if other_index is not None:
+                    total = child_cost + other_costs[other_index]
+                    if total < best_cost:
+                        best_cost = total
+                        if side == 0:
+                            meeting = (child_index, other_index)
+                        else:
+                            meeting = (other_index, child_index)
+
+        self.execution_time = time.time() - start_time
+
+        # An exhausted frontier also proves the best path optimal. A path found
+        # but not proven when the step limit ran out is not returned, as in A*.
+        if not (open_lists[0] and open_lists[1]):
+            proven = True
+        if meeting is None or not proven:
+            return None
+        return self._join_paths(arenas, meeting, heuristic_func)
+
+    @staticmethod
+    def _join_paths(
+        arenas: List[NodeArena],
+        meeting: Tuple[int, int],
+        heuristic_func: Callable[[Puzzle], int],
+    ) -> Node:
+        """
+        Build the start-to-goal Node chain through the meeting state.
+
+        The forward half is taken from the forward arena as is. The backward
+        half is replayed from the meeting state towards the goal, undoing each
+        move the backward search made.
+        """
+        forward, backward = arenas
+        forward_index, backward_index = meeting
+        node = forward.to_node(forward_index)
+
+        index = backward_index
+        while backward.parents[index] != -1:
+            move = OPPOSITE_MOVES[backward.moves[index]]
+            index = backward.parents[index]
+            state = backward.states[index]
+            node = Node(
+                state=state,
+                cost=node.cost + 1,
+                heuristic=heuristic_func(state),
+                parent=node,
+                move=move,
+            )
+        return node
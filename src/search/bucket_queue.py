@@ -0,0 +1,60 @@
+from typing import Any, List
+
+
+class BucketQueue:
+    """
+    Priority queue for small non-negative integer priorities.
+
+    Items are kept in one list (bucket) per priority value, with a pointer to
+    the lowest bucket that may be non-empty. Push is O(1) and pop is O(1)
+    amortized, since A*'s f-values only ever grow by small steps from the
+    initial estimate. Among items of equal priority the most recently pushed
+    one is popped first.
+    """
+
+    __slots__ = ("_buckets", "_min", "_size")
+
+    def __init__(self):
+        """Create an empty queue."""
+        self._buckets: List[List[Any]] = []
+        self._min = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of items in the queue."""
+        return self._size
+
+    def push(self, priority: int, item: Any):
+        """Add an item with the given priority."""
+        buckets = self._buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append(item)
+        if priority < self._min:
+            self._min = priority
+        self._size += 1
+
+    def pop(self) -> Any:
+        """Remove and return an item with the lowest priority."""
+        if not self._size:
+            raise IndexError("pop from an empty bucket queue")
+        buckets = self._buckets
+        lowest = self._min
+        while not buckets[lowest]:
+            lowest += 1
+        self._min = lowest
+        self._size -= 1
+        return buckets[lowest].pop()
+
+    def pushpop(self, priority: int, item: Any) -> Any:
+        """
+        Push an item, then pop and return an item with the lowest priority.
+
+        Equivalent to push followed by pop, but when the new item would come
+        straight back out (its priority is at or below every queued one) it is
+        returned without touching the buckets.
+        """
+        if priority <= self._min or not self._size:
+            return item
+        self.push(priority, item)
+        return self.pop()
@@ -0,0 +1,124 @@
+from typing import List, Callable, Optional, Set, Tuple
+import math
+import time
+
+from . import Search
+from ..puzzle import Puzzle
+from ..node import Node
+
+
+class IDAStarSearch(Search):
+    """Implementation of Iterative Deepening A* (IDA*) Search algorithm."""
+
+    def search(
+        self, initial_state: Puzzle, heuristic_func: Callable[[Puzzle], int]
+    ) -> Optional[Node]:
+        """
+        Perform IDA* search from the initial state.
+
+        IDA* runs a series of depth-first searches, each cut off where
+        f(n) = g(n) + h(n) exceeds a bound. The first bound is h of the
+        start state; each following one is the smallest f that exceeded the
+        previous bound. Like A*, it is optimal with an admissible heuristic,
+        but it only keeps the current path in memory instead of the open and
+        closed sets, so it can go deeper on hard 15-puzzles without running
+        out of memory. The price is that states are re-expanded across
+        iterations and along different paths.
+
+        Args:
+            initial_state: The initial puzzle state
+            heuristic_func: The heuristic function to use
+
+        Returns:
+            The goal node if found, None otherwise
+        """
+        # Reset statistics
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.execution_time = 0
+
+        # Record start time
+        start_time = time.time()
+
+        # Check if the initial state is solvable
+        if not initial_state.is_solvable():
+            print("Warning: The puzzle is not solvable!")
+            self.execution_time = time.time() - start_time
+            return None
+
+        # Check if the initial state is already the goal state
+        if initial_state.is_goal():
+            self.execution_time = time.time() - start_time
+            return Node(state=initial_state, heuristic=0)
+
+        # The current path as (state, move, h) entries, and its states for cycle checks
+        initial_h = heuristic_func(initial_state)
+        path = [(initial_state, None, initial_h)]
+        on_path = {initial_state.packed}
+        self.nodes_generated += 1
+
+        bound = initial_h
+        while True:
+            next_bound = self._bounded_search(path, on_path, 0, bound, heuristic_func)
+            if next_bound is None:
+                break
+
+            # Nothing left below any bound, or out of steps
+            if next_bound == math.inf or self.nodes_expanded >= self.max_steps:
+                self.execution_time = time.time() - start_time
+                return None
+            bound = next_bound
+
+        # Build the Node chain for the path that reached the goal
+        node = None
+        for cost, (state, move, h) in enumerate(path):
+            node = Node(state=state, cost=cost, heuristic=h, parent=node, move=move)
+
+        self.execution_time = time.time() - start_time
+        return node
+
+    def _bounded_search(
+        self,
+        path: List[Tuple[Puzzle, Optional[str], int]],
+        on_path: Set[int],
+        cost: int,
+        bound: int,
+        heuristic_func: Callable[[Puzzle], int],
+    ) -> Optional[float]:
+        """
+        Depth-first search below the last state of path, cut off at f > bound.
+
+        Returns:
+            None if the goal was reached (path then ends at the goal),
+            otherwise the smallest f-value that exceeded the bound
+        """
+        state, _, h = path[-1]
+        f = cost + h
+        if f > bound:
+            return f
+        if state.is_goal():
+            return None
+        if self.nodes_expanded >= self.max_steps:
+            return math.inf
+
+        self.nodes_expanded += 1
+        minimum = math.inf
+        for move, child in state.iter_children():
+            self.nodes_generated += 1
+            key = child.packed
+
+            # Skip states already on the current path (including the parent)
+            if key in on_path:
+                continue
+
+            path.append((child, move, heuristic_func(child)))
+            on_path.add(key)
+            result = self._bounded_search(path, on_path, cost + 1, bound, heuristic_func)
+            if result is None:
+                return None
+            if result < minimum:
+                minimum = result
+            path.pop()
+            on_path.remove(key)
+
+        return minimum
@@ -0,0 +1,228 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..puzzle import Puzzle, EXPANSIONS, GOAL_PACKED, TILE_DISTANCES
+from ..node import Node
+from ..heuristics.manhattan import manhattan_distance
+from ..heuristics.misplaced import misplaced_tiles, TILE_MISPLACED
+
+# Heuristics that are a sum of independent per-tile terms, with their
+# [pos][tile] tables per puzzle width. For these, A* can run entirely on
+# packed integer states (see packed_astar) without building Puzzle objects.
+TILE_TABLES: Dict[Callable[[Puzzle], int], Dict[int, Tuple[Tuple[int, ...], ...]]] = {
+    manhattan_distance: TILE_DISTANCES,
+    misplaced_tiles: TILE_MISPLACED,
+}
+
+# Layout of an open-list entry, packed into a single int: state in bits 0-63,
+# blank position in bits 64-67 and the g-value above that. f is not stored,
+# it is the index of the bucket holding the entry.
+_STATE_MASK = (1 << 64) - 1
+_BLANK_SHIFT = 64
+_G_SHIFT = 68
+
+# Layout of a per-state record: the best g-value in bits 0-11 and the blank
+# position of the state's parent above that. The parent state is the state
+# with the tile at that position slid back into the blank.
+_RECORD_BLANK_SHIFT = 12
+_RECORD_G_MASK = (1 << 12) - 1
+
+
+def _build_transitions(
+    size: int, table: Sequence[Sequence[int]]
+) -> Tuple[Tuple[Tuple[int, int, int, Tuple[int, ...]], ...], ...]:
+    """
+    For every blank position, precompute what packed_astar needs per move:
+    (shift, nibble_mask, blank_bits, f_deltas).
+
+    shift locates the moving tile's nibble, nibble_mask is as in EXPANSIONS,
+    and blank_bits is the blank's new position already placed in an entry.
+    f_deltas[tile] is the change in f when that tile slides into the blank:
+    1 for the step plus the change of its term in the heuristic table.
+    """
+    return tuple(
+        tuple(
+            (
+                4 * swap_pos,
+                nibble_mask,
+                swap_pos << _BLANK_SHIFT,
+                tuple(
+                    1 + to_h - from_h for to_h, from_h in zip(table[blank_pos], table[swap_pos])
+                ),
+            )
+            for _, swap_pos, nibble_mask, _ in moves
+        )
+        for blank_pos, moves in enumerate(EXPANSIONS[size])
+    )
+
+
+def _table_heuristic(state: int, table: Sequence[Sequence[int]]) -> int:
+    """Sum the per-tile table entries of a packed state."""
+    return sum(row[(state >> (4 * pos)) & 15] for pos, row in enumerate(table))
+
+
+def _make_packed_astar(
+    size: int, table: Sequence[Sequence[int]]
+) -> Callable[[int, int, int], Tuple[Optional[List[int]], int, int]]:
+    """
+    Build the packed A* search loop specialized for one puzzle width and
+    heuristic table.
+
+    The goal, the transition table with its f-deltas, and the entry layout
+    constants are bound into the closure once, so a search neither rebuilds
+    the table nor looks up module globals in its inner loop.
+    """
+    goal = GOAL_PACKED[size]
+    transitions = _build_transitions(size, table)
+    state_mask = _STATE_MASK
+    blank_shift = _BLANK_SHIFT
+    g_shift = _G_SHIFT
+    record_shift = _RECORD_BLANK_SHIFT
+    record_g_mask = _RECORD_G_MASK
+
+    def search(
+        start: int, blank_pos: int, max_steps: int
+    ) -> Tuple[Optional[List[int]], int, int]:
+        records = {start: 0}
+
+        # Open list: one bucket of entries per f-value. The heuristic is
+        # consistent, so a child's f is never below its parent's and the
+        # lowest non-empty bucket only moves up. Within a bucket the most
+        # recent entry comes out first, which favours deeper nodes.
+        lowest = _table_heuristic(start, table)
+        buckets: List[List[int]] = [[] for _ in range(lowest + 1)]
+        buckets[lowest].append((blank_pos << blank_shift) | start)
+
+        expanded = 0
+        generated = 1
+
+        while expanded < max_steps:
+            bucket = buckets[lowest]
+            if not bucket:
+                lowest += 1
+                if lowest == len(buckets):
+                    break
+                continue
+            entry = bucket.pop()
+            state = entry & state_mask
+
+            if state == goal:
+                # Trace the blank's positions back to the start
+                blank = (entry >> blank_shift) & 15
+                blanks = [blank]
+                while state != start:
+                    parent_blank = records[state] >> record_shift
+                    tile = (state >> (4 * parent_blank)) & 15
+                    state ^= tile * ((1 << (4 * parent_blank)) | (1 << (4 * blank)))
+                    blank = parent_blank
+                    blanks.append(blank)
+                blanks.reverse()
+                return blanks, expanded, generated
+
+            cost = entry >> g_shift
+
+            # Skip stale entries, superseded by a cheaper path. There is no
+            # closed set: a child is only pushed when it beats the best g seen
+            # for its state, and with a consistent heuristic an expanded
+            # state's g is already optimal, so it is never pushed again.
+            if cost > records[state] & record_g_mask:
+                continue
+
+            expanded += 1
+            blank = (entry >> blank_shift) & 15
+            child_cost = cost + 1
+            child_g = child_cost << g_shift
+            child_record = (blank << record_shift) | child_cost
+            for shift, nibble_mask, blank_bits, f_deltas in transitions[blank]:
+                generated += 1
+                tile = (state >> shift) & 15
+                child = state ^ tile * nibble_mask
+
+                known = records.get(child)
+                if known is not None and known & record_g_mask <= child_cost:
+                    continue
+
+                records[child] = child_record
+                # Only the moved tile's heuristic term changes
+                child_f = lowest + f_deltas[tile]
+                try:
+                    buckets[child_f].append(child_g | blank_bits | child)
+                except IndexError:
+                    buckets.extend([] for _ in range(child_f + 1 - len(buckets)))
+                    buckets[child_f].append(child_g | blank_bits | child)
+
+        return None, expanded, generated
+
+    return search
+
+
+# Specialized search loops behind packed_astar, built on first use per
+# (puzzle width, heuristic table)
+_PACKED_SEARCHES: Dict[
+    Tuple[int, Sequence[Sequence[int]]],
+    Callable[[int, int, int], Tuple[Optional[List[int]], int, int]],
+] = {}
+
+
+def packed_astar(
+    start: int,
+    blank_pos: int,
+    size: int,
+    table: Sequence[Sequence[int]],
+    max_steps: int,
+) -> Tuple[Optional[List[int]], int, int]:
+    """
+    A* over packed integer states with an additive per-tile heuristic.
+
+    The open list is a bucket queue of plain ints indexed by f, as f-values
+    are small integers (see the entry layout above). The best g-value of
+    each state and the blank position of its parent share one int in a
+    single dict keyed by the packed state, which also serves as the closed
+    set; the parent state itself is only rebuilt from it when the path is
+    traced back. Children are derived with a nibble extraction
+    and an XOR, and a child's f is its parent's plus a per-move delta for
+    the moved tile, so the heuristic is only summed in full for the start
+    state. No Puzzle, Node or tuple is created per expansion.
+
+    Args:
+        start: Packed initial state (see Puzzle.packed)
+        blank_pos: Index of the blank in the initial state
+        size: Width of the puzzle grid
+        table: Heuristic values indexed [pos][tile]
+        max_steps: Maximum number of nodes to expand
+
+    Returns:
+        (blank positions from start to goal or None, nodes expanded, nodes generated)
+    """
+    key = (size, table)
+    search = _PACKED_SEARCHES.get(key)
+    if search is None:
+        search = _PACKED_SEARCHES[key] = _make_packed_astar(size, table)
+    return search(start, blank_pos, max_steps)
+
+
+def path_to_node(
+    initial_state: Puzzle, blanks: List[int], heuristic_func: Callable[[Puzzle], int]
+) -> Node:
+    """
+    Build the Node chain for a path returned by packed_astar.
+
+    The path only gives the blank's position after each move, so the moves
+    are recovered from how far the blank moved and replayed from the
+    initial state. Replayed children inherit the parent's cached Manhattan
+    distance, as during a search.
+    """
+    size = initial_state.size
+    moves_by_offset = {-size: "up", size: "down", -1: "left", 1: "right"}
+    state = initial_state
+    node = Node(state=state, heuristic=heuristic_func(state))
+    for blank, next_blank in zip(blanks, blanks[1:]):
+        move = moves_by_offset[next_blank - blank]
+        state = state.apply_move(move)
+        node = Node(
+            state=state,
+            cost=node.cost + 1,
+            heuristic=heuristic_func(state),
+            parent=node,
+            move=move,
+        )
+    return node
@@ -3,6 +3,8 @@ from src.puzzle import Puzzle
 from src.heuristics.misplaced import misplaced_tiles
 from src.heuristics.manhattan import manhattan_distance
 from src.heuristics.linear_conflict import linear_conflict
+from src.heuristics.pdb import pattern_database
+from src.node import Node
 
 
 class TestHeuristics(unittest.TestCase):
@@ -22,7 +24,7 @@ class TestHeuristics(unittest.TestCase):
         self.medium_state_8 = Puzzle([1, 2, 3, 0, 5, 6, 4, 7, 8])
         
         # State with linear conflicts (row and column conflicts)
-        # (misplaced: 8, manhattan: 16, linear_conflict: 18)
+        # (misplaced: 8, manhattan: 16, linear_conflict: 20)
         self.complex_state_8 = Puzzle([8, 7, 6, 5, 4, 3, 2, 1, 0])
         
         # 15-puzzle (4×4) test cases
@@ -76,7 +78,7 @@ class TestHeuristics(unittest.TestCase):
         self.assertEqual(linear_conflict(self.medium_state_8), 3)  # Just the manhattan distance
         
         # State with multiple linear conflicts
-        self.assertEqual(linear_conflict(self.complex_state_8), 18)  # Manhattan + conflicts
+        self.assertEqual(linear_conflict(self.complex_state_8), 20)  # Manhattan + conflicts
 
     def test_misplaced_tiles_15puzzle(self):
         """Test the misplaced tiles heuristic for 15-puzzle."""
@@ -130,6 +132,42 @@ class TestHeuristics(unittest.TestCase):
             # Manhattan distance should be <= Linear conflict
             self.assertLessEqual(manhattan_distance(puzzle), linear_conflict(puzzle))
 
+    def test_linear_conflict_reversed_lines_admissible(self):
+        """Lines of three reversed tiles cost two removals, not three pairs."""
+        # States with their true (breadth-first) distances to the goal
+        cases = [
+            ([7, 8, 0, 6, 5, 4, 1, 2, 3], 26),
+            ([8, 7, 0, 6, 5, 4, 3, 2, 1], 26),
+            ([3, 8, 1, 6, 5, 4, 0, 2, 7], 26),
+            ([6, 8, 7, 3, 5, 4, 0, 2, 1], 26),
+            ([8, 0, 7, 6, 5, 4, 3, 2, 1], 27),
+            ([6, 8, 7, 0, 5, 4, 3, 2, 1], 27),
+            ([0, 8, 7, 6, 5, 4, 3, 2, 1], 28),
+        ]
+        for state, distance in cases:
+            self.assertLessEqual(linear_conflict(Puzzle(state)), distance)
+
+    def test_incremental_manhattan_matches_full(self):
+        """Test that incrementally expanded children match a full recompute."""
+        for puzzle in [self.complex_state_8, self.medium_state_8, self.medium_state_15]:
+            node = Node(state=puzzle, heuristic=manhattan_distance(puzzle))
+            for child in node.expand(manhattan_distance):
+                fresh = Puzzle(list(child.state.state))
+                self.assertEqual(child.heuristic, manhattan_distance(fresh))
+
+    def test_pattern_database_8puzzle(self):
+        """Test the pattern database heuristic on the 8-puzzle."""
+        self.assertEqual(pattern_database(self.goal_state_8), 0)
+        self.assertEqual(pattern_database(self.one_move_8), 1)
+        self.assertEqual(pattern_database(self.medium_state_8), 3)
+
+        # Never below Manhattan distance, never above the true distance (31 moves)
+        hard = Puzzle([8, 6, 7, 2, 5, 4, 3, 0, 1])
+        self.assertGreaterEqual(pattern_database(hard), manhattan_distance(hard))
+        self.assertLessEqual(pattern_database(hard), 31)
+        for puzzle in [self.complex_state_8, self.medium_state_8]:
+            self.assertGreaterEqual(pattern_database(puzzle), manhattan_distance(puzzle))
+
 
 if __name__ == "__main__":
     unittest.main()
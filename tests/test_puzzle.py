@@ -9,19 +9,19 @@ class TestPuzzle(unittest.TestCase):
         """Test that a puzzle can be initialized correctly."""
         state = [1, 2, 3, 4, 5, 6, 7, 8, 0]
         puzzle = Puzzle(state)
-        self.assertEqual(puzzle.state, state)
+        self.assertEqual(list(puzzle.state), state)
         self.assertEqual(puzzle.blank_pos, 8)
 
     def test_from_string(self):
         """Test creating a puzzle from a string."""
         state_str = "1 2 3 4 5 6 7 8 0"
         puzzle = Puzzle.from_string(state_str)
-        self.assertEqual(puzzle.state, [1, 2, 3, 4, 5, 6, 7, 8, 0])
+        self.assertEqual(list(puzzle.state), [1, 2, 3, 4, 5, 6, 7, 8, 0])
 
         # Test with a different state
         state_str = "4 5 0 6 1 8 7 3 2"
         puzzle = Puzzle.from_string(state_str)
-        self.assertEqual(puzzle.state, [4, 5, 0, 6, 1, 8, 7, 3, 2])
+        self.assertEqual(list(puzzle.state), [4, 5, 0, 6, 1, 8, 7, 3, 2])
         self.assertEqual(puzzle.blank_pos, 2)
 
     def test_legal_moves(self):
@@ -47,19 +47,51 @@ class TestPuzzle(unittest.TestCase):
 
         # Test moving up
         new_puzzle = puzzle.apply_move("up")
-        self.assertEqual(new_puzzle.state, [1, 0, 3, 4, 2, 6, 7, 8, 5])
+        self.assertEqual(list(new_puzzle.state), [1, 0, 3, 4, 2, 6, 7, 8, 5])
 
         # Test moving down
         new_puzzle = puzzle.apply_move("down")
-        self.assertEqual(new_puzzle.state, [1, 2, 3, 4, 8, 6, 7, 0, 5])
+        self.assertEqual(list(new_puzzle.state), [1, 2, 3, 4, 8, 6, 7, 0, 5])
 
         # Test moving left
         new_puzzle = puzzle.apply_move("left")
-        self.assertEqual(new_puzzle.state, [1, 2, 3, 0, 4, 6, 7, 8, 5])
+        self.assertEqual(list(new_puzzle.state), [1, 2, 3, 0, 4, 6, 7, 8, 5])
 
         # Test moving right
         new_puzzle = puzzle.apply_move("right")
-        self.assertEqual(new_puzzle.state, [1, 2, 3, 4, 6, 0, 7, 8, 5])
+        self.assertEqual(list(new_puzzle.state), [1, 2, 3, 4, 6, 0, 7, 8, 5])
+
+        # Moves that would take the blank off the board are rejected
+        corner = Puzzle([0, 2, 3, 4, 5, 6, 7, 8, 1])
+        self.assertRaises(ValueError, corner.apply_move, "up")
+        self.assertRaises(ValueError, corner.apply_move, "left")
+
+    def test_packed_state(self):
+        """Test that the packed state is kept in sync by apply_move."""
+        puzzle = Puzzle([1, 2, 3, 4, 0, 6, 7, 8, 5])
+        for move in puzzle.get_legal_moves():
+            new_puzzle = puzzle.apply_move(move)
+            self.assertEqual(new_puzzle.packed, Puzzle(list(new_puzzle.state)).packed)
+            self.assertNotEqual(new_puzzle, puzzle)
+            self.assertEqual(hash(new_puzzle), hash(Puzzle(list(new_puzzle.state))))
+
+    def test_iter_children(self):
+        """Test that iter_children matches applying each legal move."""
+        for state in ([1, 2, 3, 4, 0, 6, 7, 8, 5], [0, 2, 3, 4, 5, 6, 7, 8, 1]):
+            puzzle = Puzzle(state)
+            children = list(puzzle.iter_children())
+            self.assertEqual([move for move, _ in children], puzzle.get_legal_moves())
+            for move, child in children:
+                expected = puzzle.apply_move(move)
+                self.assertEqual(child.state, expected.state)
+                self.assertEqual(child.packed, expected.packed)
+
+    def test_str(self):
+        """Test that the board is printed one row per line for both sizes."""
+        self.assertEqual(str(Puzzle([1, 2, 3, 4, 0, 6, 7, 8, 5])), "1 2 3\n4 b 6\n7 8 5")
+        puzzle = Puzzle([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 0])
+        self.assertEqual(str(puzzle).splitlines()[-1], "13 14 15 b")
+        self.assertEqual(len(str(puzzle).splitlines()), 4)
 
     def test_is_goal(self):
         """Test checking if a state is the goal state."""
@@ -90,6 +122,17 @@ class TestPuzzle(unittest.TestCase):
             Puzzle([8, 1, 2, 7, 0, 3, 6, 5, 4]).is_solvable()
         )  # 14 inversions (even number)
 
+        # 15-puzzle: parity of the inversions and of the blank's row both matter
+        goal_15 = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 0]
+        self.assertTrue(Puzzle(goal_15).is_solvable())
+        self.assertTrue(Puzzle(goal_15).apply_move("up").is_solvable())
+        self.assertFalse(
+            Puzzle([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 15, 14, 0]).is_solvable()
+        )  # 1 inversion with the blank on the bottom row
+        self.assertTrue(
+            Puzzle([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 0, 13, 14, 15, 12]).is_solvable()
+        )  # 3 inversions with the blank one row up
+
 
 class TestRandomPuzzleGeneration(unittest.TestCase):
     """Tests for the random puzzle generation functionality."""
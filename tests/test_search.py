@@ -5,8 +5,12 @@ import sys
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.cli import run_experiment
+from src.cli import format_path, run_experiment
 from src.puzzle import Puzzle
+from src.node import NodeArena
+from src.search.bucket_queue import BucketQueue
+from src.heuristics import manhattan_distance, misplaced_tiles
+from src.search import AStarSearch
 
 
 class TestSearch(unittest.TestCase):
@@ -34,6 +38,14 @@ class TestSearch(unittest.TestCase):
             max_steps=10000,  # Ensure solution is found
         )
 
+        # Bidirectional A* must agree on the medium puzzle
+        result_medium_bi = run_experiment(
+            algorithm_name="bi-astar",
+            heuristic_name="manhattan",
+            initial_state=puzzle_medium,
+            max_steps=10000,
+        )
+
         # Verify that solutions were found
         self.assertTrue(
             result_easy["solution_found"],
@@ -59,13 +71,108 @@ class TestSearch(unittest.TestCase):
             6,  # This is the actual optimal value found by A* search
             f"Medium puzzle optimal solution should be 6 moves, got {medium_moves} moves",
         )
+        self.assertEqual(
+            result_medium_bi["solution_length"],
+            6,
+            f"Bidirectional A* should also find 6 moves, got {result_medium_bi['solution_length']}",
+        )
 
         # Print solution paths to help diagnose any issues
         print(f"\nEasy puzzle solution path (moves: {easy_moves}):")
-        print(result_easy["formatted_path"])
+        print(format_path(result_easy["solution_path"]))
         
         print(f"\nMedium puzzle solution path (moves: {medium_moves}):")
-        print(result_medium["formatted_path"])
+        print(format_path(result_medium["solution_path"]))
+
+
+    def test_optimal_searches_match_astar(self):
+        """IDA* and bidirectional A* find solutions of the same (optimal) length as A*."""
+        for state in ["1 2 3 4 0 8 7 6 5", "4 1 3 7 2 6 0 5 8", "8 6 7 2 5 4 3 0 1"]:
+            for heuristic_name in ["manhattan", "linear_conflict"]:
+                astar = run_experiment("astar", heuristic_name, state, max_steps=100000)
+                for algorithm_name in ["idastar", "bi-astar"]:
+                    result = run_experiment(
+                        algorithm_name, heuristic_name, state, max_steps=100000
+                    )
+                    self.assertTrue(result["solution_found"])
+                    self.assertEqual(result["solution_length"], astar["solution_length"])
+                    self.assertEqual(result["solution_path"][-1], (1, 2, 3, 4, 5, 6, 7, 8, 0))
+
+    def test_pattern_database_searches_are_optimal(self):
+        """A* and bidirectional A* with the pattern database find the 23-move optimum."""
+        for algorithm_name in ["astar", "bi-astar"]:
+            result = run_experiment(algorithm_name, "pdb", "5 3 8 0 7 2 6 1 4", 2000000)
+            self.assertEqual(result["solution_length"], 23)
+
+    def test_run_experiment_is_cached(self):
+        """Repeated experiments share one read-only result."""
+        first = run_experiment("astar", "manhattan", "4 1 3 7 2 6 0 5 8", 10000)
+        second = run_experiment("astar", "manhattan", "4 1 3 7 2 6 0 5 8", 10000)
+        self.assertIs(first, second)
+        self.assertEqual(first["solution_length"], 6)
+        with self.assertRaises(TypeError):
+            first["solution_length"] = 0
+        with self.assertRaises(AttributeError):
+            first["solution_path"].append(())
+        with self.assertRaises(TypeError):
+            first["solution_path"][0][0] = 0
+
+    def test_packed_astar_moves_replay_to_goal(self):
+        """A* on packed states returns moves that lead from the start to the goal."""
+        for heuristic in [manhattan_distance, misplaced_tiles]:
+            for state in [[4, 1, 3, 7, 2, 6, 0, 5, 8], [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 0, 11, 13, 14, 15, 12]]:
+                puzzle = Puzzle(state)
+                goal_node = AStarSearch(max_steps=100000).search(puzzle, heuristic)
+                for move in goal_node.get_moves_path():
+                    puzzle = puzzle.apply_move(move)
+                self.assertTrue(puzzle.is_goal())
+                self.assertEqual(goal_node.state, puzzle)
+
+
+class TestNodeArena(unittest.TestCase):
+    def test_solution_path_from_arena(self):
+        """Nodes stored by index reconstruct the same path as a Node chain."""
+        arena = NodeArena()
+        start = Puzzle([1, 2, 3, 4, 5, 6, 0, 7, 8])
+        root = arena.add(start, heuristic=manhattan_distance(start))
+
+        parent = root
+        for move in ["right", "right"]:
+            child_state = arena.states[parent].apply_move(move)
+            parent = arena.add(child_state, arena.costs[parent] + 1, 0, parent, move)
+
+        node = arena.to_node(parent)
+        self.assertTrue(node.state.is_goal())
+        self.assertEqual(node.get_moves_path(), ["right", "right"])
+        self.assertEqual(arena.get_solution_path(parent), node.get_solution_path())
+
+
+class TestBucketQueue(unittest.TestCase):
+    def test_pops_lowest_priority_first(self):
+        """Items come out by priority, most recent first among ties."""
+        queue = BucketQueue()
+        for priority, item in [(5, "a"), (3, "b"), (5, "c"), (7, "d"), (3, "e")]:
+            queue.push(priority, item)
+        self.assertEqual(len(queue), 5)
+
+        popped = [queue.pop() for _ in range(3)]
+        self.assertEqual(popped, ["e", "b", "c"])
+
+        # A push below the current minimum is still found first
+        queue.push(1, "f")
+        self.assertEqual([queue.pop() for _ in range(3)], ["f", "a", "d"])
+        self.assertEqual(len(queue), 0)
+        self.assertRaises(IndexError, queue.pop)
+
+    def test_pushpop(self):
+        """pushpop behaves like push followed by pop."""
+        queue = BucketQueue()
+        self.assertEqual(queue.pushpop(4, "a"), "a")
+        queue.push(4, "b")
+        self.assertEqual(queue.pushpop(4, "c"), "c")
+        self.assertEqual(queue.pushpop(6, "d"), "b")
+        self.assertEqual(queue.pop(), "d")
+        self.assertEqual(len(queue), 0)
 
 
 if __name__ == "__main__":